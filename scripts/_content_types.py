@@ -0,0 +1,32 @@
+"""
+Shared Content-Type mapping for the Screen Recorder scripts
+===========================================================
+
+Imported by the scripts in this directory:
+
+    from _content_types import CONTENT_TYPES, content_type_for
+"""
+
+from pathlib import Path
+
+# Content types by (lowercase) file extension
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.json': 'application/json',
+    '.svg': 'image/svg+xml',
+    '.png': 'image/png',
+    '.ico': 'image/x-icon',
+    '.exe': 'application/octet-stream',
+    '.msi': 'application/octet-stream',
+    '.dmg': 'application/octet-stream',
+    '.appimage': 'application/octet-stream',
+    '.deb': 'application/vnd.debian.binary-package',
+    '.rpm': 'application/x-rpm',
+}
+
+
+def content_type_for(filename: str) -> str:
+    """Return the content type for a file name based on its extension."""
+    return CONTENT_TYPES.get(Path(filename).suffix.lower(), 'application/octet-stream')
@@ -0,0 +1,39 @@
+"""
+Shared .env loading for the Screen Recorder scripts
+===================================================
+
+Imported by the scripts in this directory:
+
+    from _env import load_env
+"""
+
+import os
+import re
+import functools
+from pathlib import Path
+
+ENV_FILE = Path("/workspace/.env")
+
+# KEY=value lines of a .env file, optionally prefixed with "export"; values
+# may be wrapped in double or single quotes (comments and blank lines never match)
+ENV_LINE_RE = re.compile(
+    rb'^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*'
+    rb'(?:"([^"\n]*)"|\'([^\'\n]*)\'|(.*?))[ \t\r]*$',
+    re.MULTILINE
+)
+
+
+@functools.lru_cache(maxsize=1)
+def load_env():
+    """Load environment variables from .env file if not already set (once per run)."""
+    if not ENV_FILE.exists():
+        return
+
+    # Scan the raw bytes (minus a UTF-8 BOM left by some editors);
+    # only the matched keys and values get decoded
+    content = ENV_FILE.read_bytes().removeprefix(b'\xef\xbb\xbf')
+    for match in ENV_LINE_RE.finditer(content):
+        key = match.group(1).decode()
+        if not os.environ.get(key):
+            value = next(v for v in match.group(2, 3, 4) if v is not None)
+            os.environ[key] = value.decode()
@@ -39,8 +39,8 @@ Environment Variables (from .env):
     MINIO_ROOT_PASSWORD  - MinIO admin password
     CAP_AWS_SECRET_KEY   - Service account secret key (for create command)
 
-Note: The 'policy' command requires the MinIO Client (mc) to be installed.
-      It is available in the tools container.
+Note: The 'policy' command and 'list --with-stats' use the MinIO admin API
+      (minio package). It is available in the tools container.
 
 Run from tools container:
     docker compose -f docker-compose.tools.yml run --rm tools python3 /workspace/scripts/bucket-manager.py <command>
@@ -50,15 +50,20 @@ import os
 import sys
 import json
 import argparse
-import subprocess
-import tempfile
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+from functools import partial
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+
+from _env import load_env
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
     from botocore.client import Config
     from botocore.exceptions import ClientError
+    from minio import MinioAdmin
+    from minio.credentials import StaticProvider
     from rich.console import Console
     from rich.panel import Panel
     from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -66,29 +71,65 @@ try:
     from rich.prompt import Confirm
 except ImportError:
     print("ERROR: Required packages not installed. Run:")
-    print("  pip3 install boto3 rich")
+    print("  pip3 install boto3 minio rich")
     sys.exit(1)
 
+# Optional: faster JSON encoding/decoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+# (source_client, target_client) of a cross-server copy worker process
+_worker_clients = None
+
+# User metadata key holding the source ETag of a copied object
+SOURCE_ETAG_METADATA = 'source-etag'
+
+# Server-side copy settings: objects from 64 MB up are copied in 64 MB parts
+# (several at once) instead of a single CopyObject, which is limited to 5 GB
+SAME_SERVER_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 * 1024 * 1024,
+    multipart_chunksize=64 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
+# Streaming transfer settings for cross-server copies: objects are piped in
+# 16 MB parts, so memory per worker stays constant regardless of object size
+CROSS_SERVER_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True
+)
+
+
+def json_dumps(obj, indent: bool = False) -> str:
+    """Serialize obj to a JSON string (2-space indent if requested)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
 
-def load_env():
-    """Load environment variables from .env file if not already set."""
-    env_file = Path("/workspace/.env")
-    if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, _, value = line.partition('=')
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and not os.environ.get(key):
-                        os.environ[key] = value
 
+def json_loads(text: str):
+    """Parse a JSON string (e.g. a MinIO admin API response)."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
 
-def get_s3_client(endpoint: str = None, access_key: str = None, secret_key: str = None, region: str = 'global'):
-    """Create and return an S3 client configured for MinIO."""
+
+def get_s3_client(endpoint: str = None, access_key: str = None, secret_key: str = None, region: str = 'global',
+                  workers: int = 32, transfer_concurrency: int = 0):
+    """
+    Create and return an S3 client configured for MinIO.
+
+    The connection pool is sized so a single client can be shared by all
+    threads of a worker pool (boto3 clients are thread-safe): each worker
+    needs one connection plus one per concurrent part of its managed transfer.
+    """
     load_env()
 
     if endpoint is None:
@@ -115,41 +156,155 @@ def get_s3_client(endpoint: str = None, access_key: str = None, secret_key: str
         endpoint_url=endpoint_url,
         aws_access_key_id=access_key,
         aws_secret_access_key=secret_key,
-        config=Config(signature_version='s3v4'),
+        config=Config(
+            signature_version='s3v4',
+            max_pool_connections=max(32, workers * (transfer_concurrency + 1)),
+            # Keep idle pooled connections from being reaped by NATs/load balancers
+            tcp_keepalive=True,
+            connect_timeout=10,
+            read_timeout=120,
+            # Adaptive mode rate-limits the whole pool after throttling errors
+            retries={'mode': 'adaptive', 'max_attempts': 5},
+            # Skip client-side CRC32 checksums on uploads/downloads unless an
+            # operation requires them (MinIO does not)
+            request_checksum_calculation='when_required',
+            response_checksum_validation='when_required'
+        ),
         region_name=region
     )
 
 
-def list_objects(s3_client, bucket: str) -> list:
-    """List all objects in a bucket."""
+def iter_objects(s3_client, bucket: str, prefix: str = '', keys_only: bool = False):
+    """
+    Yield all objects in a bucket (optionally below a prefix) page by page.
+
+    With keys_only, each object is reduced to {'Key': ...} right away so the
+    full listing entries can be freed as soon as their page is consumed.
+    Listing errors are raised to the caller: a partial listing must not pass
+    for the whole bucket.
+    """
+    paginator = s3_client.get_paginator('list_objects_v2')
+
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix, FetchOwner=False):
+        if keys_only:
+            yield from ({'Key': obj['Key']} for obj in page.get('Contents', []))
+        else:
+            yield from page.get('Contents', [])
+
+
+def list_objects_parallel(s3_client, bucket: str, workers: int = 16, keys_only: bool = False) -> list:
+    """
+    List all objects in a bucket, listing top-level prefixes in parallel.
+
+    A delimited listing discovers the top-level prefixes (and any objects at
+    the bucket root); each prefix is then paginated in its own thread, so the
+    serial page round-trips are spread across the worker pool. If any part
+    of the listing fails, nothing is returned.
+    """
     objects = []
+    prefixes = []
     paginator = s3_client.get_paginator('list_objects_v2')
 
     try:
-        for page in paginator.paginate(Bucket=bucket):
-            if 'Contents' in page:
-                objects.extend(page['Contents'])
+        for page in paginator.paginate(Bucket=bucket, Delimiter='/', FetchOwner=False):
+            if keys_only:
+                objects.extend({'Key': obj['Key']} for obj in page.get('Contents', []))
+            else:
+                objects.extend(page.get('Contents', []))
+            prefixes.extend(p['Prefix'] for p in page.get('CommonPrefixes', []))
     except ClientError as e:
         console.print(f"[red]Error listing objects: {e}[/red]")
         return []
 
+    if prefixes:
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for shard in executor.map(lambda prefix: list(iter_objects(s3_client, bucket, prefix, keys_only)), prefixes):
+                    objects.extend(shard)
+        except ClientError as e:
+            console.print(f"[red]Error listing objects: {e}[/red]")
+            return []
+
     return objects
 
 
-def copy_object(source_client, target_client, source_bucket: str, target_bucket: str, key: str) -> bool:
-    """Copy a single object from source to target bucket."""
+def sum_sizes(objects: list) -> int:
+    """Return the total size of listed objects."""
+    # map/itemgetter keeps the whole loop in C (no generator frame per object)
+    return sum(map(itemgetter('Size'), objects))
+
+
+def map_bounded(executor, fn, items, max_pending: int):
+    """
+    Submit fn(item) for every item, keeping at most max_pending tasks in flight.
+
+    Yields (item, result) pairs as tasks complete. Items may come from a lazy
+    generator; it is only advanced as fast as the workers drain the queue.
+    """
+    pending = {}
+
+    for item in items:
+        if len(pending) >= max_pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+        pending[executor.submit(fn, item)] = item
+
+    for future in as_completed(pending):
+        yield pending[future], future.result()
+
+
+def copy_object(source_client, target_client, source_bucket: str, target_bucket: str, key: str, size: int,
+                etag: str) -> bool:
+    """
+    Copy a single object from source to target bucket.
+
+    When source and target share the same client (same server), the copy is
+    done server-side so the object data never passes through this machine.
+    Large objects are copied as parallel multipart UploadPartCopy requests.
+    Copies that may get a new ETag record the source ETag as metadata
+    (see target_has_object).
+    """
     try:
-        # Download from source
+        if source_client is target_client:
+            copy_source = {'Bucket': source_bucket, 'Key': key}
+
+            # Single-part sources keep their ETag in a plain CopyObject
+            if size < SAME_SERVER_TRANSFER_CONFIG.multipart_threshold and '-' not in etag:
+                target_client.copy_object(Bucket=target_bucket, Key=key, CopySource=copy_source)
+                return True
+
+            # Replaced headers are not carried over from the source by themselves
+            head = target_client.head_object(Bucket=source_bucket, Key=key)
+            extra_args = {
+                'ContentType': head.get('ContentType', 'application/octet-stream'),
+                'Metadata': {**head.get('Metadata', {}), SOURCE_ETAG_METADATA: etag.strip('"')}
+            }
+
+            if size < SAME_SERVER_TRANSFER_CONFIG.multipart_threshold:
+                target_client.copy_object(Bucket=target_bucket, Key=key, CopySource=copy_source,
+                                          MetadataDirective='REPLACE', **extra_args)
+                return True
+
+            target_client.copy(
+                copy_source,
+                target_bucket,
+                key,
+                ExtraArgs=extra_args,
+                Config=SAME_SERVER_TRANSFER_CONFIG
+            )
+            return True
+
+        # Different servers: stream the source body straight into the target
         response = source_client.get_object(Bucket=source_bucket, Key=key)
-        body = response['Body'].read()
         content_type = response.get('ContentType', 'application/octet-stream')
 
-        # Upload to target
-        target_client.put_object(
-            Bucket=target_bucket,
-            Key=key,
-            Body=body,
-            ContentType=content_type
+        target_client.upload_fileobj(
+            response['Body'],
+            target_bucket,
+            key,
+            ExtraArgs={'ContentType': content_type, 'Metadata': {SOURCE_ETAG_METADATA: etag.strip('"')}},
+            Config=CROSS_SERVER_TRANSFER_CONFIG
         )
         return True
     except ClientError as e:
@@ -157,6 +312,66 @@ def copy_object(source_client, target_client, source_bucket: str, target_bucket:
         return False
 
 
+def init_copy_worker(source_config: dict, target_config: dict):
+    """Create the S3 clients of a copy worker process (clients cannot be pickled)."""
+    global _worker_clients
+    _worker_clients = (get_s3_client(**source_config), get_s3_client(**target_config))
+
+
+def copy_object_in_worker(source_bucket: str, target_bucket: str, skip_existing: bool, obj: dict):
+    """Copy a single listed object using the clients of the current worker process."""
+    source_client, target_client = _worker_clients
+    return copy_listed_object(source_client, target_client, source_bucket, target_bucket, skip_existing, obj)
+
+
+def copy_listed_object(source_client, target_client, source_bucket: str, target_bucket: str,
+                       skip_existing: bool, obj: dict):
+    """
+    Copy a listed object, optionally skipping it if the target already has it.
+    Returns True if copied, False if the copy failed, None if skipped.
+    """
+    if skip_existing and target_has_object(target_client, target_bucket, obj):
+        return None
+
+    return copy_object(source_client, target_client, source_bucket, target_bucket, obj['Key'], obj['Size'], obj['ETag'])
+
+
+def target_has_object(target_client, target_bucket: str, obj: dict) -> bool:
+    """
+    Check whether the target bucket already holds a listed source object.
+
+    Multipart and streamed copies get a different ETag than the source, so the
+    source ETag recorded by copy_object at copy time matches too.
+    """
+    try:
+        head = target_client.head_object(Bucket=target_bucket, Key=obj['Key'])
+    except ClientError:
+        return False
+
+    if head.get('ETag') == obj['ETag']:
+        return True
+    return head.get('Metadata', {}).get(SOURCE_ETAG_METADATA) == obj['ETag'].strip('"')
+
+
+def delete_batch(s3_client, bucket: str, batch: list):
+    """Delete a batch of up to 1000 objects with a single DeleteObjects request."""
+    try:
+        response = s3_client.delete_objects(
+            Bucket=bucket,
+            Delete={
+                'Objects': [{'Key': obj['Key']} for obj in batch],
+                'Quiet': True
+            }
+        )
+    except ClientError as e:
+        console.print(f"[red]Error deleting objects: {e}[/red]")
+        return
+
+    # Quiet mode only reports the keys that could not be deleted
+    for error in response.get('Errors', []):
+        console.print(f"[red]Failed to delete {error.get('Key')}: {error.get('Message')}[/red]")
+
+
 def cmd_copy(args):
     """Copy bucket contents from source to target."""
     console.print(Panel.fit(
@@ -167,11 +382,15 @@ def cmd_copy(args):
 
     # Create source client
     console.print("\n[bold]Step 1: Connecting to source[/bold]")
-    source_client = get_s3_client(
-        endpoint=args.source_endpoint,
-        access_key=args.source_access_key,
-        secret_key=args.source_secret_key
-    )
+    source_config = {
+        'endpoint': args.source_endpoint,
+        'access_key': args.source_access_key,
+        'secret_key': args.source_secret_key,
+        'workers': args.workers,
+        # Same-server copies run their multipart copies on this client too
+        'transfer_concurrency': 0 if args.target_endpoint else SAME_SERVER_TRANSFER_CONFIG.max_concurrency
+    }
+    source_client = get_s3_client(**source_config)
 
     try:
         source_client.head_bucket(Bucket=args.source)
@@ -183,16 +402,23 @@ def cmd_copy(args):
     # Create target client (same or different server)
     console.print("\n[bold]Step 2: Connecting to target[/bold]")
     if args.target_endpoint:
-        target_client = get_s3_client(
-            endpoint=args.target_endpoint,
-            access_key=args.target_access_key,
-            secret_key=args.target_secret_key
-        )
+        target_config = {
+            'endpoint': args.target_endpoint,
+            'access_key': args.target_access_key,
+            'secret_key': args.target_secret_key,
+            'workers': args.workers,
+            'transfer_concurrency': CROSS_SERVER_TRANSFER_CONFIG.max_concurrency
+        }
+        target_client = get_s3_client(**target_config)
         console.print(f"[dim]Using different target server: {args.target_endpoint}[/dim]")
     else:
         target_client = source_client
         console.print("[dim]Using same server for target[/dim]")
 
+        if args.source == args.target:
+            console.print("[yellow]![/yellow] Source and target are the same bucket on the same server, nothing to copy")
+            return 0
+
     # Check if target bucket exists, create if not
     try:
         target_client.head_bucket(Bucket=args.target)
@@ -208,27 +434,55 @@ def cmd_copy(args):
 
     # List source objects
     console.print("\n[bold]Step 3: Listing source objects[/bold]")
-    objects = list_objects(source_client, args.source)
+    if args.yes:
+        # No confirmation needed: stream objects into the copy workers as the
+        # listing pages arrive instead of listing the whole bucket first
+        objects = iter_objects(source_client, args.source)
+        total = None
+        console.print("[dim]Skipping preflight listing, objects are copied as they are listed[/dim]")
+    else:
+        objects = list_objects_parallel(source_client, args.source)
 
-    if not objects:
-        console.print("[yellow]![/yellow] No objects found in source bucket")
-        return 0
+        if not objects:
+            console.print("[yellow]![/yellow] No objects found in source bucket")
+            return 0
 
-    console.print(f"[green]✓[/green] Found {len(objects)} objects to copy")
+        total = len(objects)
+        console.print(f"[green]✓[/green] Found {total} objects to copy")
 
-    # Calculate total size
-    total_size = sum(obj['Size'] for obj in objects)
-    console.print(f"[dim]Total size: {total_size / (1024*1024):.2f} MB[/dim]")
+        # Calculate total size
+        total_size = sum_sizes(objects)
+        console.print(f"[dim]Total size: {total_size / (1024*1024):.2f} MB[/dim]")
 
-    # Confirm before copying
-    if not args.yes:
-        if not Confirm.ask(f"Copy {len(objects)} objects from '{args.source}' to '{args.target}'?"):
+        # Confirm before copying
+        if not Confirm.ask(f"Copy {total} objects from '{args.source}' to '{args.target}'?"):
             console.print("[yellow]Cancelled[/yellow]")
             return 0
 
     # Copy objects
     console.print("\n[bold]Step 4: Copying objects[/bold]")
+
+    # Optionally spread cross-server copies (every byte passes through this
+    # machine) over processes; same-server copies are server-side and stay on threads
+    if args.target_endpoint and args.processes > 0:
+        executor = ProcessPoolExecutor(
+            max_workers=args.processes,
+            # Workers start while the progress display thread runs - don't fork
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=init_copy_worker,
+            initargs=(source_config, target_config)
+        )
+        copy_fn = partial(copy_object_in_worker, args.source, args.target, args.skip_existing)
+        max_pending = 4 * args.processes
+        console.print(f"[dim]Using {args.processes} worker processes[/dim]")
+    else:
+        executor = ThreadPoolExecutor(max_workers=args.workers)
+        copy_fn = partial(copy_listed_object, source_client, target_client, args.source, args.target, args.skip_existing)
+        max_pending = 4 * args.workers
+        console.print(f"[dim]Using {args.workers} parallel workers[/dim]")
+
     success_count = 0
+    skipped_count = 0
     failed_count = 0
 
     with Progress(
@@ -236,25 +490,46 @@ def cmd_copy(args):
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TaskProgressColumn(),
-        console=console
+        console=console,
+        refresh_per_second=4
     ) as progress:
-        task = progress.add_task("Copying...", total=len(objects))
-
-        for obj in objects:
-            key = obj['Key']
-            progress.update(task, description=f"[cyan]{key[:50]}...[/cyan]" if len(key) > 50 else f"[cyan]{key}[/cyan]")
-
-            if copy_object(source_client, target_client, args.source, args.target, key):
-                success_count += 1
-            else:
-                failed_count += 1
-
-            progress.advance(task)
+        task = progress.add_task("Copying...", total=total)
+
+        with executor:
+            results = map_bounded(executor, copy_fn, objects, max_pending=max_pending)
+
+            try:
+                for done, (obj, copied) in enumerate(results):
+                    # Only show every 64th key; the bar only redraws 4x per second anyway
+                    if done % 64 == 0:
+                        key = obj['Key']
+                        progress.update(task, description=f"[cyan]{key[:50]}...[/cyan]" if len(key) > 50 else f"[cyan]{key}[/cyan]")
+
+                    if copied is None:
+                        skipped_count += 1
+                    elif copied:
+                        success_count += 1
+                    else:
+                        failed_count += 1
+
+                    progress.advance(task)
+            except ClientError as e:
+                # Streamed listing (--yes) failed part-way: the copy is incomplete
+                console.print(f"[red]✗[/red] Error listing objects: {e}")
+                return 1
+
+        if total is None:
+            progress.update(task, total=success_count + skipped_count + failed_count)
+
+    if success_count + skipped_count + failed_count == 0:
+        console.print("[yellow]![/yellow] No objects found in source bucket")
+        return 0
 
     # Summary
     console.print(Panel.fit(
         f"[bold green]Copy Complete![/bold green]\n\n"
         f"Copied: [green]{success_count}[/green]\n"
+        f"Skipped: [cyan]{skipped_count}[/cyan]\n"
         f"Failed: [red]{failed_count}[/red]",
         border_style="green" if failed_count == 0 else "yellow"
     ))
@@ -272,7 +547,7 @@ def cmd_delete(args):
 
     # Connect to MinIO
     console.print("\n[bold]Step 1: Connecting to MinIO[/bold]")
-    s3_client = get_s3_client()
+    s3_client = get_s3_client(workers=args.workers)
 
     try:
         s3_client.head_bucket(Bucket=args.bucket)
@@ -283,7 +558,7 @@ def cmd_delete(args):
 
     # List objects
     console.print("\n[bold]Step 2: Listing objects[/bold]")
-    objects = list_objects(s3_client, args.bucket)
+    objects = list_objects_parallel(s3_client, args.bucket, keys_only=True)
     console.print(f"[dim]Found {len(objects)} objects[/dim]")
 
     # Confirm deletion
@@ -308,20 +583,16 @@ def cmd_delete(args):
         ) as progress:
             task = progress.add_task("Deleting...", total=len(objects))
 
-            # Delete in batches of 1000 (S3 limit)
-            for i in range(0, len(objects), 1000):
-                batch = objects[i:i+1000]
-                delete_objects = [{'Key': obj['Key']} for obj in batch]
-
-                try:
-                    s3_client.delete_objects(
-                        Bucket=args.bucket,
-                        Delete={'Objects': delete_objects}
-                    )
-                except ClientError as e:
-                    console.print(f"[red]Error deleting objects: {e}[/red]")
+            # Delete in batches of 1000 (S3 limit), several batches at a time
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                futures = {
+                    executor.submit(delete_batch, s3_client, args.bucket, objects[i:i+1000]): len(objects[i:i+1000])
+                    for i in range(0, len(objects), 1000)
+                }
 
-                progress.advance(task, len(batch))
+                for future in as_completed(futures):
+                    future.result()
+                    progress.advance(task, futures[future])
 
         console.print(f"[green]✓[/green] Deleted {len(objects)} objects")
 
@@ -410,7 +681,7 @@ def cmd_create(args):
         try:
             s3_client.put_bucket_policy(
                 Bucket=args.bucket,
-                Policy=json.dumps(public_policy)
+                Policy=json_dumps(public_policy)
             )
             console.print(f"[green]✓[/green] Set public read policy")
         except ClientError as e:
@@ -456,7 +727,7 @@ def cmd_create(args):
         console.print()
         console.print(f"[cyan]# Create policy file[/cyan]")
         console.print(f"cat > /tmp/{policy_name}.json << 'EOF'")
-        console.print(json.dumps(policy_json, indent=2))
+        console.print(json_dumps(policy_json, indent=True))
         console.print("EOF")
         console.print()
         console.print(f"[cyan]# Apply policy[/cyan]")
@@ -500,17 +771,27 @@ def cmd_list(args):
     table = Table(show_header=True, header_style="bold")
     table.add_column("Bucket")
     table.add_column("Created")
-    table.add_column("Objects")
-    table.add_column("Size")
+    if args.with_stats:
+        table.add_column("Objects")
+        table.add_column("Size")
+
+    # Usage counters for all buckets in a single admin request
+    usage = get_buckets_usage() if args.with_stats else {}
 
     for bucket in buckets:
         name = bucket['Name']
         created = bucket['CreationDate'].strftime('%Y-%m-%d %H:%M')
 
-        # Get object count and size
-        objects = list_objects(s3_client, name)
-        obj_count = len(objects)
-        total_size = sum(obj['Size'] for obj in objects)
+        if not args.with_stats:
+            table.add_row(name, created)
+            continue
+
+        # Get object count and size (listing only buckets the scanner has not reported yet)
+        if name in usage:
+            obj_count, total_size = usage[name]
+        else:
+            objects = list_objects_parallel(s3_client, name)
+            obj_count, total_size = len(objects), sum_sizes(objects)
         size_str = f"{total_size / (1024*1024):.2f} MB" if total_size > 0 else "0 B"
 
         table.add_row(name, created, str(obj_count), size_str)
@@ -519,64 +800,61 @@ def cmd_list(args):
     return 0
 
 
-def run_mc_command(cmd: list, description: str = None) -> tuple:
-    """
-    Run a MinIO mc CLI command.
-    Returns (success: bool, output: str)
-    """
+def get_minio_admin():
+    """Create and return a MinIO admin API client."""
     load_env()
 
-    # Get credentials
     endpoint = os.environ.get('S3_HOSTNAME', 'localhost:9000')
     admin_user = os.environ.get('MINIO_ROOT_USER', 'admin')
     admin_password = os.environ.get('MINIO_ROOT_PASSWORD', '')
 
-    # Determine protocol
-    if 'localhost' in endpoint or '127.0.0.1' in endpoint or ':9000' in endpoint:
-        protocol = 'http'
+    # Determine protocol (an explicit scheme in the hostname wins)
+    if '://' in endpoint:
+        scheme, _, endpoint = endpoint.partition('://')
+        secure = scheme == 'https'
     else:
-        protocol = 'https'
-
-    endpoint_url = f"{protocol}://{endpoint}"
+        secure = not ('localhost' in endpoint or '127.0.0.1' in endpoint or ':9000' in endpoint)
 
-    # First, configure the mc alias
-    alias_cmd = ['mc', 'alias', 'set', 'minio', endpoint_url, admin_user, admin_password, '--api', 's3v4']
+    return MinioAdmin(
+        endpoint.rstrip('/'),
+        credentials=StaticProvider(admin_user, admin_password),
+        secure=secure
+    )
 
-    try:
-        result = subprocess.run(
-            alias_cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        if result.returncode != 0:
-            return False, f"Failed to configure mc alias: {result.stderr}"
-    except subprocess.TimeoutExpired:
-        return False, "mc alias command timed out"
-    except FileNotFoundError:
-        return False, "mc CLI not found. Please install MinIO Client (mc)"
-    except Exception as e:
-        return False, f"Error configuring mc alias: {e}"
 
-    # Now run the actual command
+def run_admin_command(func, *args, description: str = None, **kwargs) -> tuple:
+    """
+    Run a MinIO admin API call.
+    Returns (success: bool, output: str)
+    """
     if description:
         console.print(f"[dim]Running: {description}[/dim]")
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        if result.returncode == 0:
-            return True, result.stdout
-        else:
-            return False, result.stderr
-    except subprocess.TimeoutExpired:
-        return False, "Command timed out"
+        return True, func(*args, **kwargs)
     except Exception as e:
-        return False, f"Error running command: {e}"
+        return False, f"Error running admin request: {e}"
+
+
+def get_buckets_usage() -> dict:
+    """
+    Return {bucket: (object_count, total_size)} from MinIO's server-side
+    usage counters (as last reported by the data usage scanner).
+    """
+    success, output = run_admin_command(get_minio_admin().get_data_usage_info)
+    if not success:
+        console.print(f"[yellow]![/yellow] Could not read usage info, listing objects instead: {output}")
+        return {}
+
+    try:
+        buckets_usage = json_loads(output).get('bucketsUsageInfo') or {}
+    except ValueError:
+        return {}
+
+    return {
+        name: (info.get('objectsCount', 0), info.get('size', 0))
+        for name, info in buckets_usage.items()
+    }
 
 
 def cmd_policy(args):
@@ -625,58 +903,50 @@ def cmd_policy(args):
 
     console.print(f"[green]✓[/green] Policy document created for bucket '{args.bucket}'")
 
-    # Create temporary policy file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(policy_json, f, indent=2)
-        policy_file = f.name
-
-    try:
-        # Step 2: Check if user exists
-        console.print("\n[bold]Step 2: Checking user exists[/bold]")
-        success, output = run_mc_command(
-            ['mc', 'admin', 'user', 'info', 'minio', args.user],
-            f"mc admin user info minio {args.user}"
-        )
-
-        if not success:
-            console.print(f"[red]✗[/red] User '{args.user}' not found or error: {output}")
-            console.print("[dim]  Create the user first or check the username[/dim]")
-            return 1
+    admin = get_minio_admin()
 
-        console.print(f"[green]✓[/green] User '{args.user}' exists")
-
-        # Step 3: Remove old policy if it exists (we'll recreate it)
-        console.print("\n[bold]Step 3: Updating policy[/bold]")
+    # Step 2: Check if user exists
+    console.print("\n[bold]Step 2: Checking user exists[/bold]")
+    success, output = run_admin_command(
+        admin.user_info, args.user,
+        description=f"Reading user info for '{args.user}'"
+    )
 
-        # Try to remove existing policy first (ignore errors if it doesn't exist)
-        run_mc_command(
-            ['mc', 'admin', 'policy', 'detach', 'minio', policy_name, '--user', args.user],
-            f"Detaching old policy '{policy_name}' from user"
-        )
+    if not success:
+        console.print(f"[red]✗[/red] User '{args.user}' not found or error: {output}")
+        console.print("[dim]  Create the user first or check the username[/dim]")
+        return 1
 
-        # Delete old policy (ignore errors)
-        run_mc_command(
-            ['mc', 'admin', 'policy', 'remove', 'minio', policy_name],
-            f"Removing old policy '{policy_name}'"
-        )
+    console.print(f"[green]✓[/green] User '{args.user}' exists")
 
-        # Create new policy
-        success, output = run_mc_command(
-            ['mc', 'admin', 'policy', 'create', 'minio', policy_name, policy_file],
-            f"Creating policy '{policy_name}'"
-        )
+    try:
+        user_info = json_loads(output)
+        attached_policies = [p.strip() for p in user_info.get('policyName', '').split(',') if p.strip()]
+    except ValueError:
+        attached_policies = []
+
+    # Step 3: Create or replace the policy (adding overwrites an existing one)
+    console.print("\n[bold]Step 3: Updating policy[/bold]")
+    success, output = run_admin_command(
+        admin.policy_add, policy_name, policy=policy_json,
+        description=f"Creating policy '{policy_name}'"
+    )
 
-        if not success:
-            console.print(f"[red]✗[/red] Failed to create policy: {output}")
-            return 1
+    if not success:
+        console.print(f"[red]✗[/red] Failed to create policy: {output}")
+        return 1
 
-        console.print(f"[green]✓[/green] Created policy '{policy_name}'")
+    console.print(f"[green]✓[/green] Created policy '{policy_name}'")
 
-        # Step 4: Attach policy to user
-        console.print("\n[bold]Step 4: Attaching policy to user[/bold]")
-        success, output = run_mc_command(
-            ['mc', 'admin', 'policy', 'attach', 'minio', policy_name, '--user', args.user],
-            f"Attaching policy to user '{args.user}'"
+    # Step 4: Attach policy to user (skipped if it is already attached)
+    console.print("\n[bold]Step 4: Attaching policy to user[/bold]")
+    if policy_name in attached_policies:
+        console.print(f"[green]✓[/green] Policy already attached to user '{args.user}'")
+    else:
+        success, output = run_admin_command(
+            # Attach adds to the user's existing policies (policy_set would replace them)
+            admin.attach_policy, [policy_name], user=args.user,
+            description=f"Attaching policy to user '{args.user}'"
         )
 
         if not success:
@@ -685,24 +955,17 @@ def cmd_policy(args):
 
         console.print(f"[green]✓[/green] Attached policy to user '{args.user}'")
 
-        # Step 5: Verify
+    # Step 5: Show resulting configuration
+    if args.verbose:
         console.print("\n[bold]Step 5: Verifying configuration[/bold]")
-        success, output = run_mc_command(
-            ['mc', 'admin', 'user', 'info', 'minio', args.user],
-            f"Verifying user '{args.user}'"
+        success, output = run_admin_command(
+            admin.user_info, args.user,
+            description=f"Verifying user '{args.user}'"
         )
 
         if success:
             console.print(f"[green]✓[/green] User configuration verified")
-            if args.verbose:
-                console.print(f"[dim]{output}[/dim]")
-
-    finally:
-        # Clean up temp file
-        try:
-            os.unlink(policy_file)
-        except Exception:
-            pass
+            console.print(f"[dim]{output}[/dim]")
 
     # Summary
     console.print(Panel.fit(
@@ -728,6 +991,9 @@ Examples:
   # List all buckets
   python3 bucket-manager.py list
 
+  # List all buckets with object count and size
+  python3 bucket-manager.py list --with-stats
+
   # Copy bucket on same server
   python3 bucket-manager.py copy --source videos --target media --create-target
 
@@ -751,6 +1017,7 @@ Examples:
 
     # List command
     list_parser = subparsers.add_parser('list', help='List all buckets')
+    list_parser.add_argument('--with-stats', action='store_true', help='Show object count and size per bucket (from MinIO usage info)')
 
     # Copy command
     copy_parser = subparsers.add_parser('copy', help='Copy bucket contents')
@@ -758,6 +1025,10 @@ Examples:
     copy_parser.add_argument('--target', '-t', required=True, help='Target bucket name')
     copy_parser.add_argument('--create-target', action='store_true', help='Create target bucket if it does not exist')
     copy_parser.add_argument('--yes', '-y', action='store_true', help='Skip confirmation')
+    copy_parser.add_argument('--skip-existing', action='store_true', help='Skip objects that already exist in the target with the same ETag')
+    copy_parser.add_argument('--workers', '-w', type=int, default=32, help='Number of parallel copy workers (default: 32)')
+    copy_parser.add_argument('--processes', type=int, default=0,
+                             help='Use worker processes instead of --workers threads for cross-server copies (default: 0 = threads)')
 
     # Source server options
     copy_parser.add_argument('--source-endpoint', help='Source server endpoint (default: from env)')
@@ -773,6 +1044,7 @@ Examples:
     delete_parser = subparsers.add_parser('delete', help='Delete a bucket')
     delete_parser.add_argument('--bucket', '-b', required=True, help='Bucket name to delete')
     delete_parser.add_argument('--yes', '-y', action='store_true', help='Skip confirmation')
+    delete_parser.add_argument('--workers', '-w', type=int, default=16, help='Number of parallel delete requests (default: 16)')
 
     # Create command
     create_parser = subparsers.add_parser('create', help='Create a new bucket')
@@ -788,7 +1060,7 @@ Examples:
     policy_parser.add_argument('--bucket', '-b', required=True, help='Bucket name to grant access to')
     policy_parser.add_argument('--user', '-u', required=True, help='MinIO user name')
     policy_parser.add_argument('--policy-name', '-p', help='Custom policy name (default: <user>-policy)')
-    policy_parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed output')
+    policy_parser.add_argument('--verbose', '-v', action='store_true', help='Verify and show the resulting user configuration')
 
     args = parser.parse_args()
 
@@ -28,8 +28,14 @@ Run from tools container:
 
 import os
 import sys
+import functools
+import gzip
 import json
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from _env import load_env
+from _content_types import content_type_for
 
 try:
     import boto3
@@ -50,6 +56,9 @@ BUCKET_NAME = "downloads"
 ASSETS_DIR = Path("/workspace/assets")
 HTML_FILE = ASSETS_DIR / "download-page.html"
 
+# Number of assets uploaded at the same time
+UPLOAD_WORKERS = 4
+
 # Public read policy for the bucket
 PUBLIC_READ_POLICY = {
     "Version": "2012-10-17",
@@ -70,23 +79,9 @@ PUBLIC_READ_POLICY = {
 }
 
 
-def load_env():
-    """Load environment variables from .env file if not already set."""
-    env_file = Path("/workspace/.env")
-    if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, _, value = line.partition('=')
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and not os.environ.get(key):
-                        os.environ[key] = value
-
-
+@functools.lru_cache(maxsize=1)
 def get_s3_client():
-    """Create and return an S3 client configured for MinIO."""
+    """Create and return an S3 client configured for MinIO (built once per run)."""
     load_env()
 
     # Get configuration from environment
@@ -111,7 +106,14 @@ def get_s3_client():
         endpoint_url=endpoint_url,
         aws_access_key_id=access_key,
         aws_secret_access_key=secret_key,
-        config=Config(signature_version='s3v4'),
+        config=Config(
+            signature_version='s3v4',
+            max_pool_connections=32,
+            # Back off across all threads when MinIO answers SlowDown
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+            # MinIO serves buckets path-style (no bucket subdomain DNS lookups)
+            s3={'addressing_style': 'path'}
+        ),
         region_name='global'
     )
 
@@ -152,10 +154,12 @@ def set_bucket_policy(s3_client):
         return False
 
 
-def process_html_template(html_content: str) -> str:
+def process_html_template(html_content: bytes) -> bytes:
     """
     Process HTML template by replacing placeholders with environment values.
 
+    Works on the raw UTF-8 bytes, so the page is never decoded/re-encoded.
+
     Placeholders:
     - {WEB_URL} -> Main application URL from environment
     """
@@ -163,11 +167,11 @@ def process_html_template(html_content: str) -> str:
 
     if web_url:
         # Replace {WEB_URL} placeholder with actual URL
-        html_content = html_content.replace('{WEB_URL}', web_url)
+        html_content = html_content.replace(b'{WEB_URL}', web_url.encode('utf-8'))
         console.print(f"[green]✓[/green] Replaced {{WEB_URL}} placeholder with: {web_url}")
     else:
         # Fallback to "/" if WEB_URL not set
-        html_content = html_content.replace('{WEB_URL}', '/')
+        html_content = html_content.replace(b'{WEB_URL}', b'/')
         console.print("[yellow]![/yellow] WEB_URL not set - using '/' as fallback")
 
     return html_content
@@ -185,22 +189,7 @@ def upload_file(s3_client, local_path: Path, s3_key: str, content_type: str = No
 
     # Determine content type from extension if not specified
     if not content_type:
-        ext = local_path.suffix.lower()
-        content_types = {
-            '.html': 'text/html; charset=utf-8',
-            '.css': 'text/css',
-            '.js': 'application/javascript',
-            '.json': 'application/json',
-            '.svg': 'image/svg+xml',
-            '.png': 'image/png',
-            '.ico': 'image/x-icon',
-            '.exe': 'application/octet-stream',
-            '.dmg': 'application/octet-stream',
-            '.appimage': 'application/octet-stream',
-            '.deb': 'application/vnd.debian.binary-package',
-            '.rpm': 'application/x-rpm',
-        }
-        extra_args['ContentType'] = content_types.get(ext, 'application/octet-stream')
+        extra_args['ContentType'] = content_type_for(local_path.name)
 
     try:
         s3_client.upload_file(
@@ -224,15 +213,16 @@ def upload_html_with_replacements(s3_client, local_path: Path, s3_key: str):
 
     try:
         # Read and process HTML
-        html_content = local_path.read_text(encoding='utf-8')
+        html_content = local_path.read_bytes()
         processed_html = process_html_template(html_content)
 
-        # Upload processed content
+        # Upload processed content pre-compressed (browsers decode it transparently)
         s3_client.put_object(
             Bucket=BUCKET_NAME,
             Key=s3_key,
-            Body=processed_html.encode('utf-8'),
-            ContentType='text/html; charset=utf-8'
+            Body=gzip.compress(processed_html, compresslevel=9),
+            ContentType='text/html; charset=utf-8',
+            ContentEncoding='gzip'
         )
         console.print(f"[green]✓[/green] Uploaded: {s3_key}")
         return True
@@ -289,21 +279,30 @@ def main():
     # Step 3: Upload files
     console.print("\n[bold]Step 3: Upload assets[/bold]")
 
-    # Upload index.html (with WEB_URL replacement)
-    if HTML_FILE.exists():
-        upload_html_with_replacements(s3_client, HTML_FILE, "index.html")
-    else:
-        console.print(f"[yellow]![/yellow] HTML file not found at {HTML_FILE}")
-        console.print("[dim]  Create it at: assets/download-page.html[/dim]")
-
-    # Create and upload favicon
+    # Create favicon if missing
     favicon_path = ASSETS_DIR / "favicon.svg"
     if not favicon_path.exists():
         # Create favicon SVG
         favicon_path.parent.mkdir(parents=True, exist_ok=True)
         favicon_path.write_text(create_favicon_svg())
         console.print(f"[green]✓[/green] Created favicon.svg")
-    upload_file(s3_client, favicon_path, "favicon.svg")
+
+    # Upload assets in parallel (shared client, one request each)
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+        futures = []
+
+        # Upload index.html (with WEB_URL replacement)
+        if HTML_FILE.exists():
+            futures.append(executor.submit(upload_html_with_replacements, s3_client, HTML_FILE, "index.html"))
+        else:
+            console.print(f"[yellow]![/yellow] HTML file not found at {HTML_FILE}")
+            console.print("[dim]  Create it at: assets/download-page.html[/dim]")
+
+        futures.append(executor.submit(upload_file, s3_client, favicon_path, "favicon.svg"))
+
+        # Re-raise unexpected errors (connection, file access) from the workers
+        for future in futures:
+            future.result()
 
     # Summary
     console.print()
@@ -11,20 +11,27 @@ Features:
 - Supports both GitHub assets and CrabNebula CDN downloads
 - Downloads all available platform installers (Windows, macOS, Linux)
 - Uploads to MinIO with standardized lowercase filenames
+- Skips assets that are already up-to-date in MinIO
+- Caches release information (revalidated via ETag)
+- Publishes an index.json manifest for the download page
 - Shows download progress
 
 Usage:
-    python3 sync-clients.py [--version VERSION]
+    python3 sync-clients.py [--version VERSION] [--versioned] [--allow-downgrade]
 
 Arguments:
     --version VERSION  Specific version tag (e.g., cap-v0.4.82)
                        If not specified, uses CAP_VERSION from .env
+    --versioned        Also keep each installer under cap/<tag>/ and reuse
+                       identical installers from earlier versions
+    --allow-downgrade  Sync even if version.txt names a newer version
 
 Environment Variables (from .env):
     CAP_VERSION          - Version to sync (should match your server!)
     S3_HOSTNAME          - MinIO hostname
     MINIO_ROOT_USER      - MinIO admin username
     MINIO_ROOT_PASSWORD  - MinIO admin password
+    GITHUB_TOKEN         - Optional GitHub token (raises the API rate limit)
 
 Run from tools container:
     docker compose -f docker-compose.tools.yml run --rm tools python3 /workspace/scripts/sync-clients.py
@@ -32,16 +39,24 @@ Run from tools container:
 
 import os
 import sys
+import functools
+import hashlib
 import re
+import json
+import time
 import argparse
-import tempfile
-import shutil
+from collections import deque
 from pathlib import Path
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+
+from _env import load_env
+from _content_types import content_type_for
 
 try:
     import boto3
-    import requests
+    import httpx
+    from boto3.s3.transfer import TransferConfig
     from botocore.client import Config
     from botocore.exceptions import ClientError
     from rich.console import Console
@@ -53,7 +68,7 @@ try:
     from rich.table import Table
 except ImportError:
     print("ERROR: Required packages not installed. Run:")
-    print("  pip3 install boto3 requests rich")
+    print("  pip3 install boto3 'httpx[http2]' rich")
     sys.exit(1)
 
 console = Console()
@@ -62,60 +77,124 @@ console = Console()
 BUCKET_NAME = "downloads"
 GITHUB_REPO = "CapSoftware/Cap"
 GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases"
+CACHE_FILE = Path("/workspace/.cache/cap-release.json")
+VERSIONED_PREFIX = "cap/"
+# Verified streams are uploaded here first and only copied into place once
+# their checksum matched
+STAGING_PREFIX = ".staging/"
+
+# Multipart settings for streaming downloads into MinIO: parts are uploaded
+# in parallel while the download continues
+STREAM_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# Number of installers transferred at the same time
+SYNC_WORKERS = 4
+
+# Large installers are downloaded as parallel byte ranges, each range
+# becoming one multipart part in MinIO
+RANGED_MIN_SIZE = 64 * 1024 * 1024
+RANGED_PART_SIZE = 16 * 1024 * 1024
+RANGED_CONNECTIONS = 4
+
+# Shared HTTP/2 client for all GitHub/CDN requests: parallel downloads from
+# the same host are multiplexed over one TLS connection, and failed
+# connection attempts are retried
+# (pool settings belong to the transport - httpx ignores the client's own
+# http2/limits arguments once a transport is given)
+HTTP_CLIENT = httpx.Client(
+    follow_redirects=True,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+    ),
+    timeout=httpx.Timeout(30.0, read=300.0),
+    headers={"User-Agent": "cap-sync/1.0"}
+)
+
+# Separate HTTP/1.1 client for ranged downloads: every parallel range gets
+# its own TCP connection (and window) instead of sharing one HTTP/2 connection
+RANGE_CLIENT = httpx.Client(
+    follow_redirects=True,
+    transport=httpx.HTTPTransport(
+        retries=3,
+        limits=httpx.Limits(
+            max_connections=SYNC_WORKERS * RANGED_CONNECTIONS,
+            max_keepalive_connections=SYNC_WORKERS * RANGED_CONNECTIONS
+        )
+    ),
+    timeout=httpx.Timeout(30.0, read=300.0),
+    headers={"User-Agent": "cap-sync/1.0"}
+)
+
+# Transient HTTP errors (rate limiting, CDN hiccups) are retried with backoff
+RETRY_STATUSES = {429, 502, 503, 504}
+HTTP_ATTEMPTS = 5
 
 # =============================================================================
 # Asset mappings for GitHub release assets (older releases)
-# Format: (pattern_in_name, target_filename, content_type)
+# Format: (pattern_in_name, target_filename)
+# Content types are derived from the target file extension
 # =============================================================================
 GITHUB_ASSET_MAPPINGS = [
     # Windows
-    ("_x64-setup.exe", "cap-windows-x64.exe", "application/octet-stream"),
-    ("_x64_en-US.msi", "cap-windows-x64.msi", "application/octet-stream"),
-    ("_arm64-setup.exe", "cap-windows-arm64.exe", "application/octet-stream"),
+    ("_x64-setup.exe", "cap-windows-x64.exe"),
+    ("_x64_en-US.msi", "cap-windows-x64.msi"),
+    ("_arm64-setup.exe", "cap-windows-arm64.exe"),
 
     # macOS
-    ("_universal.dmg", "cap-macos-universal.dmg", "application/octet-stream"),
-    ("_x64.dmg", "cap-macos-x64.dmg", "application/octet-stream"),
-    ("_aarch64.dmg", "cap-macos-arm64.dmg", "application/octet-stream"),
+    ("_universal.dmg", "cap-macos-universal.dmg"),
+    ("_x64.dmg", "cap-macos-x64.dmg"),
+    ("_aarch64.dmg", "cap-macos-arm64.dmg"),
 
     # Linux
-    ("_amd64.AppImage", "cap-linux-x64.AppImage", "application/octet-stream"),
-    ("_amd64.deb", "cap-linux-x64.deb", "application/vnd.debian.binary-package"),
-    ("_x86_64.rpm", "cap-linux-x64.rpm", "application/x-rpm"),
+    ("_amd64.AppImage", "cap-linux-x64.AppImage"),
+    ("_amd64.deb", "cap-linux-x64.deb"),
+    ("_x86_64.rpm", "cap-linux-x64.rpm"),
 ]
 
+# All asset patterns as one alternation; the matching group (g<index>)
+# identifies the mapping, so each asset name is scanned only once
+_ASSET_RE = re.compile('|'.join(
+    f'(?P<g{i}>{re.escape(pattern)})' for i, (pattern, _) in enumerate(GITHUB_ASSET_MAPPINGS)
+))
+
 # =============================================================================
 # CrabNebula CDN mappings (newer releases since ~v0.3.x)
-# Maps markdown link text patterns to target filenames
+# Maps link text to target filenames: all (lowercase) words of a key must
+# appear in the link text
 # =============================================================================
 CRABNEBULA_MAPPINGS = [
-    # Pattern in release body -> (target_filename, content_type, file_extension)
-    (r"macOS.*Apple Silicon", "cap-macos-arm64.dmg", "application/octet-stream", ".dmg"),
-    (r"macOS.*Intel", "cap-macos-x64.dmg", "application/octet-stream", ".dmg"),
-    (r"Windows", "cap-windows-x64.exe", "application/octet-stream", ".exe"),
+    # Words in link text -> target_filename
+    (("macos", "apple silicon"), "cap-macos-arm64.dmg"),
+    (("macos", "intel"), "cap-macos-x64.dmg"),
+    (("windows",), "cap-windows-x64.exe"),
     # Linux (if available in future)
-    (r"Linux.*AppImage", "cap-linux-x64.AppImage", "application/octet-stream", ".AppImage"),
-    (r"Linux.*deb", "cap-linux-x64.deb", "application/vnd.debian.binary-package", ".deb"),
+    (("linux", "appimage"), "cap-linux-x64.AppImage"),
+    (("linux", "deb"), "cap-linux-x64.deb"),
 ]
 
-
-def load_env():
-    """Load environment variables from .env file if not already set."""
-    env_file = Path("/workspace/.env")
-    if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, _, value = line.partition('=')
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and not os.environ.get(key):
-                        os.environ[key] = value
+# CrabNebula CDN links in a release body, all forms in one pattern so the
+# body is scanned once. Each alternative captures a (text, url) group pair.
+CRABNEBULA_LINK_RE = re.compile('|'.join([
+    # Markdown link: [macOS (Apple Silicon)](https://cdn.crabnebula.app/...)
+    r'\[([^\]]+)\]\((https://cdn\.crabnebula\.app/[^)]+)\)',
+    # Bold text with URL: **macOS (Apple Silicon)**: https://cdn.crabnebula.app/...
+    r'\*\*([^*]+)\*\*[:\s]+(https://cdn\.crabnebula\.app/\S+)',
+    # Plain text with URL: - macOS (Apple Silicon): https://cdn.crabnebula.app/...
+    # (one line only, starting with the dash, so bullets can't swallow the next line)
+    r'^[ \t]*-[ \t]*([^:\n]+):\s*(https://cdn\.crabnebula\.app/\S+)',
+]), re.IGNORECASE | re.MULTILINE)
 
 
+@functools.lru_cache(maxsize=1)
 def get_s3_client():
-    """Create and return an S3 client configured for MinIO."""
+    """Create and return an S3 client configured for MinIO (built once per run)."""
     load_env()
 
     endpoint = os.environ.get('S3_HOSTNAME', 'localhost:9000')
@@ -138,74 +217,156 @@ def get_s3_client():
         endpoint_url=endpoint_url,
         aws_access_key_id=access_key,
         aws_secret_access_key=secret_key,
-        config=Config(signature_version='s3v4'),
+        # Every concurrent installer upload runs its own multipart part uploads
+        config=Config(
+            signature_version='s3v4',
+            max_pool_connections=SYNC_WORKERS * STREAM_TRANSFER_CONFIG.max_concurrency + SYNC_WORKERS,
+            # Back off across all threads when MinIO answers SlowDown
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+            # MinIO serves buckets path-style (no bucket subdomain DNS lookups)
+            s3={'addressing_style': 'path'}
+        ),
         region_name='global'
     )
 
 
+def http_get(url: str, headers: dict = None, read_body: bool = True, client: httpx.Client = None):
+    """
+    GET through the shared client (or the given one), retrying transient errors
+    (honors Retry-After).
+
+    With read_body=False only status and headers are fetched; the body is
+    never downloaded (the response is closed right away).
+    """
+    client = client or HTTP_CLIENT
+    for attempt in range(HTTP_ATTEMPTS):
+        response = client.send(client.build_request('GET', url, headers=headers), stream=not read_body)
+        if not read_body:
+            response.close()
+        if response.status_code not in RETRY_STATUSES or attempt == HTTP_ATTEMPTS - 1:
+            return response
+
+        retry_after = response.headers.get('retry-after', '')
+        time.sleep(int(retry_after) if retry_after.isdigit() else 0.3 * 2 ** attempt)
+
+
+def load_cache() -> dict:
+    """Load cached release responses ({url: {'etag': ..., 'release': ...}})."""
+    try:
+        return json.loads(CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: dict):
+    """Persist cached release responses (best effort)."""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps(cache))
+    except OSError as e:
+        console.print(f"[dim]Could not write release cache: {e}[/dim]")
+
+
+def fetch_release(url: str):
+    """
+    Fetch release information from GitHub.
+
+    A previously cached response is revalidated with If-None-Match; GitHub
+    answers 304 Not Modified (not counted against the rate limit) if unchanged.
+    """
+    cache = load_cache()
+    cached = cache.get(url)
+
+    headers = {"Accept": "application/vnd.github+json"}
+
+    # Authenticated requests get 5000 instead of 60 API calls per hour
+    token = os.environ.get('GITHUB_TOKEN')
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    if cached:
+        headers["If-None-Match"] = cached['etag']
+
+    response = http_get(url, headers=headers)
+    if response.status_code == 304 and cached:
+        return cached['release']
+    response.raise_for_status()
+
+    release = response.json()
+    etag = response.headers.get('ETag')
+    if etag:
+        cache[url] = {'etag': etag, 'release': release}
+        save_cache(cache)
+
+    return release
+
+
 def get_latest_release():
     """Fetch the latest release from GitHub."""
-    response = requests.get(
-        f"{GITHUB_API_URL}/latest",
-        headers={"Accept": "application/vnd.github+json"}
-    )
-    response.raise_for_status()
-    return response.json()
+    return fetch_release(f"{GITHUB_API_URL}/latest")
 
 
 def get_release_by_tag(tag: str):
     """Fetch a specific release by tag from GitHub."""
-    response = requests.get(
-        f"{GITHUB_API_URL}/tags/{tag}",
-        headers={"Accept": "application/vnd.github+json"}
-    )
-    response.raise_for_status()
-    return response.json()
+    return fetch_release(f"{GITHUB_API_URL}/tags/{tag}")
 
 
-def find_matching_asset(assets: list, pattern: str):
-    """Find a GitHub asset matching the given pattern."""
-    for asset in assets:
-        if pattern in asset['name']:
-            return asset
-    return None
+def expected_asset_name(tag: str, pattern: str) -> str:
+    """Build the exact asset filename for a release tag (e.g. cap-v0.3.50 -> Cap_0.3.50_x64-setup.exe)."""
+    version = re.sub(r'^(?:cap-)?v', '', tag)
+    return f"Cap_{version}{pattern}"
+
+
+def match_github_assets(assets: list, tag: str) -> dict:
+    """Map each target filename to its GitHub asset (exact name first, pattern scan as fallback)."""
+    name_index = {asset['name']: asset for asset in assets}
+
+    # Fallback: first asset matching each pattern
+    scanned = None
+
+    matches = {}
+    for pattern, target_name in GITHUB_ASSET_MAPPINGS:
+        asset = name_index.get(expected_asset_name(tag, pattern))
+        if asset is None:
+            if scanned is None:
+                scanned = {}
+                for candidate in assets:
+                    m = _ASSET_RE.search(candidate['name'])
+                    if m:
+                        scanned.setdefault(GITHUB_ASSET_MAPPINGS[int(m.lastgroup[1:])][1], candidate)
+            asset = scanned.get(target_name)
+            if asset:
+                console.print(f"[dim]  {expected_asset_name(tag, pattern)} not found, using {asset['name']}[/dim]")
+        matches[target_name] = asset
+    return matches
 
 
 def parse_crabnebula_downloads(release_body: str) -> list:
     """
     Parse release body for CrabNebula CDN download links.
 
-    Returns list of tuples: (platform_text, url, target_filename, content_type)
+    Returns list of tuples: (platform_text, url, target_filename)
     """
     downloads = []
 
     if not release_body:
         return downloads
 
-    # Find all markdown links with cdn.crabnebula.app
-    # Pattern: [text](url) or **text**: url
-    patterns = [
-        # Markdown link: [macOS (Apple Silicon)](https://cdn.crabnebula.app/...)
-        r'\[([^\]]+)\]\((https://cdn\.crabnebula\.app/[^)]+)\)',
-        # Bold text with URL: **macOS (Apple Silicon)**: https://cdn.crabnebula.app/...
-        r'\*\*([^*]+)\*\*[:\s]+(https://cdn\.crabnebula\.app/\S+)',
-        # Plain text with URL: - macOS (Apple Silicon): https://cdn.crabnebula.app/...
-        r'-\s*([^:]+):\s*(https://cdn\.crabnebula\.app/\S+)',
-    ]
-
+    # Find all links with cdn.crabnebula.app
     found_urls = {}  # Deduplicate by URL
 
-    for pattern in patterns:
-        matches = re.findall(pattern, release_body, re.IGNORECASE)
-        for platform_text, url in matches:
-            if url not in found_urls:
-                found_urls[url] = platform_text.strip()
+    for match in CRABNEBULA_LINK_RE.finditer(release_body):
+        # Only the matching alternative's groups are set
+        platform_text, url = (group for group in match.groups() if group is not None)
+        if url not in found_urls:
+            found_urls[url] = platform_text.strip(" *")
 
     # Map found URLs to our target filenames
     for url, platform_text in found_urls.items():
-        for pattern, target_name, content_type, ext in CRABNEBULA_MAPPINGS:
-            if re.search(pattern, platform_text, re.IGNORECASE):
-                downloads.append((platform_text, url, target_name, content_type))
+        text = platform_text.lower()
+        for words, target_name in CRABNEBULA_MAPPINGS:
+            if all(word in text for word in words):
+                downloads.append((platform_text, url, target_name))
                 break
         else:
             # Unknown platform - use generic name based on URL
@@ -214,46 +375,454 @@ def parse_crabnebula_downloads(release_body: str) -> list:
     return downloads
 
 
-def download_file(url: str, dest_path: Path, progress: Progress, task_id) -> bool:
-    """Download a file with progress tracking."""
-    try:
-        # Follow redirects and get final response
-        response = requests.get(url, stream=True, allow_redirects=True)
-        response.raise_for_status()
+class ProgressReader:
+    """
+    File-like wrapper around a download stream that advances a progress task
+    and computes the SHA256 of everything read.
 
-        total_size = int(response.headers.get('content-length', 0))
-        progress.update(task_id, total=total_size)
+    Network chunks are buffered until a full read is available. upload_fileobj
+    reads whole multipart parts (8 MB) at a time, so progress is updated once
+    per part rather than per small network chunk.
+    """
 
-        with open(dest_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    progress.update(task_id, advance=len(chunk))
+    def __init__(self, chunks, progress: Progress, task_id):
+        self.chunks = chunks
+        self.buffer = bytearray()
+        self.progress = progress
+        self.task_id = task_id
+        self.bytes_read = 0
+        self.sha256 = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
 
-        return True
-    except Exception as e:
-        console.print(f"[red]Download failed: {e}[/red]")
+        if size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+
+        self.bytes_read += len(data)
+        self.sha256.update(data)
+        self.progress.update(self.task_id, advance=len(data))
+        return data
+
+
+def is_up_to_date(s3_client, s3_key: str, asset: dict) -> bool:
+    """Check whether MinIO already holds this exact GitHub asset (same size and asset ID)."""
+    try:
+        head = s3_client.head_object(Bucket=BUCKET_NAME, Key=s3_key)
+    except ClientError:
         return False
 
+    return (
+        head.get('ContentLength') == asset.get('size')
+        and head.get('Metadata', {}).get('github-id') == asset.get('node_id')
+    )
+
+
+def asset_metadata(asset: dict) -> dict:
+    """Object metadata identifying a GitHub asset (used to skip or reuse uploads)."""
+    metadata = {'github-id': asset['node_id']}
+
+    # Newer releases publish a content digest ("sha256:<hex>")
+    digest = asset.get('digest') or ''
+    if digest.startswith('sha256:'):
+        metadata['sha256'] = digest[len('sha256:'):]
+
+    return metadata
+
+
+def list_versioned_objects(s3_client) -> list:
+    """List installers stored under the versioned prefix by earlier runs."""
+    objects = []
+    paginator = s3_client.get_paginator('list_objects_v2')
 
-def upload_to_s3(s3_client, local_path: Path, s3_key: str, content_type: str) -> bool:
-    """Upload a file to S3/MinIO."""
     try:
-        s3_client.upload_file(
-            str(local_path),
-            BUCKET_NAME,
-            s3_key,
-            ExtraArgs={'ContentType': content_type}
+        for page in paginator.paginate(Bucket=BUCKET_NAME, Prefix=VERSIONED_PREFIX):
+            objects.extend(page.get('Contents', []))
+    except ClientError as e:
+        console.print(f"[yellow]![/yellow] Could not list previous versions: {e}")
+
+    return objects
+
+
+def find_previous_version(s3_client, asset: dict, versioned_objects: list):
+    """Return the key of an earlier versioned installer with identical content, or None."""
+    sha256 = asset_metadata(asset).get('sha256')
+    if not sha256:
+        return None
+
+    for obj in versioned_objects:
+        if obj['Size'] != asset.get('size'):
+            continue
+        try:
+            head = s3_client.head_object(Bucket=BUCKET_NAME, Key=obj['Key'])
+        except ClientError:
+            continue
+        if head.get('Metadata', {}).get('sha256') == sha256:
+            return obj['Key']
+
+    return None
+
+
+def copy_within_bucket(s3_client, source_key: str, target_key: str, metadata: dict) -> bool:
+    """Copy an object inside the bucket (server-side, no data through this machine)."""
+    try:
+        s3_client.copy_object(
+            Bucket=BUCKET_NAME,
+            Key=target_key,
+            CopySource={'Bucket': BUCKET_NAME, 'Key': source_key},
+            MetadataDirective='REPLACE',
+            ContentType=content_type_for(target_key),
+            Metadata=metadata
         )
         return True
     except ClientError as e:
-        console.print(f"[red]Upload failed: {e}[/red]")
+        console.print(f"[red]Copy {source_key} -> {target_key} failed: {e}[/red]")
         return False
 
 
+def stream_to_s3(s3_client, url: str, s3_key: str, content_type: str, progress: Progress, task_id,
+                 metadata: dict = None, expected_sha256: str = None):
+    """
+    Stream a download straight into S3/MinIO (no temp file).
+
+    The response body is fed to a multipart upload, so downloading and
+    uploading overlap. With expected_sha256 set, MinIO verifies every part
+    checksum and the download goes to a staging key first: it replaces the
+    installer only if it matches, otherwise the previous installer stays.
+    Returns (bytes transferred, SHA256 hex digest), or None on failure.
+    """
+    extra_args = {'ContentType': content_type}
+    if metadata:
+        extra_args['Metadata'] = metadata
+    if expected_sha256:
+        extra_args['ChecksumAlgorithm'] = 'SHA256'
+    upload_key = f"{STAGING_PREFIX}{s3_key}" if expected_sha256 else s3_key
+
+    try:
+        # Follow redirects and get final response
+        with HTTP_CLIENT.stream('GET', url) as response:
+            response.raise_for_status()
+
+            total_size = int(response.headers.get('content-length', 0))
+            if total_size:
+                progress.update(task_id, total=total_size)
+
+            # Remember the source ETag for conditional requests on later runs
+            if response.headers.get('etag'):
+                extra_args['Metadata'] = {**extra_args.get('Metadata', {}), 'source-etag': response.headers['etag']}
+
+            reader = ProgressReader(response.iter_bytes(chunk_size=1024 * 1024), progress, task_id)
+            s3_client.upload_fileobj(
+                reader,
+                BUCKET_NAME,
+                upload_key,
+                ExtraArgs=extra_args,
+                Config=STREAM_TRANSFER_CONFIG
+            )
+
+        if expected_sha256:
+            # Never replace an installer with a corrupted download
+            if reader.sha256.hexdigest() != expected_sha256:
+                console.print(f"[red]Checksum mismatch for {s3_key}, keeping previous installer[/red]")
+                return None
+            if not copy_within_bucket(s3_client, upload_key, s3_key, extra_args.get('Metadata', {})):
+                return None
+
+        return reader.bytes_read, reader.sha256.hexdigest()
+    except Exception as e:
+        console.print(f"[red]Transfer failed: {e}[/red]")
+        return None
+    finally:
+        if upload_key != s3_key:
+            try:
+                s3_client.delete_object(Bucket=BUCKET_NAME, Key=upload_key)
+            except ClientError:
+                pass
+
+
+def probe_download(url: str, etag: str = None) -> tuple:
+    """
+    Probe a download with a one-byte range request.
+
+    Returns (unchanged, size, etag): unchanged is True if the server answered
+    304 to If-None-Match with the given etag; size is the total size if the
+    server honors byte ranges, else None.
+    """
+    headers = {'Range': 'bytes=0-0'}
+    if etag:
+        headers['If-None-Match'] = etag
+
+    try:
+        # A server ignoring Range answers 200 with the whole file - don't read it
+        response = http_get(url, headers=headers, read_body=False)
+    except httpx.HTTPError:
+        return False, None, None
+
+    if response.status_code == 304:
+        return True, None, etag
+
+    # 206 with "Content-Range: bytes 0-0/<total>"
+    etag = response.headers.get('etag')
+    content_range = response.headers.get('content-range', '')
+    if response.status_code != 206 or '/' not in content_range:
+        return False, None, etag
+    total = content_range.rsplit('/', 1)[1]
+    return False, int(total) if total.isdigit() else None, etag
+
+
+def ranged_to_s3(s3_client, url: str, s3_key: str, size: int, content_type: str, progress: Progress, task_id,
+                 metadata: dict = None, expected_sha256: str = None):
+    """
+    Download byte ranges in parallel and upload each range as one multipart part.
+
+    Ranges are hashed in order as they complete, so at most RANGED_CONNECTIONS
+    parts are held in memory. On a checksum mismatch the upload is aborted
+    before it becomes visible. Returns (bytes transferred, SHA256 hex digest), or None on failure.
+    """
+    checksum_args = {'ChecksumAlgorithm': 'SHA256'} if expected_sha256 else {}
+    upload_id = None
+
+    def transfer_part(part_number: int, start: int, end: int):
+        response = http_get(url, headers={'Range': f'bytes={start}-{end}'}, client=RANGE_CLIENT)
+        response.raise_for_status()
+        data = response.content
+        if len(data) != end - start + 1:
+            raise ValueError(f"Range {start}-{end} returned {len(data)} bytes")
+
+        part = s3_client.upload_part(
+            Bucket=BUCKET_NAME, Key=s3_key, UploadId=upload_id,
+            PartNumber=part_number, Body=data, **checksum_args
+        )
+        progress.update(task_id, advance=len(data))
+
+        entry = {'PartNumber': part_number, 'ETag': part['ETag']}
+        if 'ChecksumSHA256' in part:
+            entry['ChecksumSHA256'] = part['ChecksumSHA256']
+        return entry, data
+
+    ranges = [
+        (number, start, min(start + RANGED_PART_SIZE, size) - 1)
+        for number, start in enumerate(range(0, size, RANGED_PART_SIZE), start=1)
+    ]
+    sha256 = hashlib.sha256()
+    parts = []
+
+    try:
+        upload_id = s3_client.create_multipart_upload(
+            Bucket=BUCKET_NAME, Key=s3_key, ContentType=content_type, Metadata=metadata or {}, **checksum_args
+        )['UploadId']
+
+        with ThreadPoolExecutor(max_workers=RANGED_CONNECTIONS) as executor:
+            pending = deque()
+            for part_range in ranges:
+                pending.append(executor.submit(transfer_part, *part_range))
+                # Consume in order once the window is full
+                while len(pending) >= RANGED_CONNECTIONS:
+                    entry, data = pending.popleft().result()
+                    sha256.update(data)
+                    parts.append(entry)
+            for future in pending:
+                entry, data = future.result()
+                sha256.update(data)
+                parts.append(entry)
+
+        if expected_sha256 and sha256.hexdigest() != expected_sha256:
+            raise ValueError(f"Checksum mismatch for {s3_key}")
+
+        s3_client.complete_multipart_upload(
+            Bucket=BUCKET_NAME, Key=s3_key, UploadId=upload_id, MultipartUpload={'Parts': parts}
+        )
+        return size, sha256.hexdigest()
+    except Exception as e:
+        console.print(f"[red]Transfer failed: {e}[/red]")
+        if upload_id:
+            try:
+                s3_client.abort_multipart_upload(Bucket=BUCKET_NAME, Key=s3_key, UploadId=upload_id)
+            except ClientError:
+                pass
+        return None
+
+
+def manifest_entry(name: str, size: int, sha256: str = None) -> dict:
+    """Describe one installer in the bucket for index.json."""
+    return {'name': name, 'size': size, 'sha256': sha256, 'url': name}
+
+
+def transfer_asset(s3_client, url: str, target_name: str, progress: Progress,
+                   total: int = None, metadata: dict = None, expected_sha256: str = None,
+                   conditional: bool = False) -> tuple:
+    """
+    Stream one installer to MinIO.
+
+    With conditional set, the source ETag stored by the previous upload is sent
+    as If-None-Match and the transfer is skipped if the server answers 304.
+
+    Returns a (filename, status, color, manifest_entry) summary row; the entry
+    is None if the installer is not in the bucket.
+    """
+    content_type = content_type_for(target_name)
+
+    previous = None
+    if conditional:
+        try:
+            previous = s3_client.head_object(Bucket=BUCKET_NAME, Key=target_name)
+        except ClientError:
+            pass
+    previous_etag = previous.get('Metadata', {}).get('source-etag') if previous else None
+
+    # Large (or unknown-size) downloads: split into ranges if the server allows it
+    unchanged, size, source_etag = (
+        probe_download(url, previous_etag)
+        if previous_etag or not total or total >= RANGED_MIN_SIZE else (False, None, None)
+    )
+    if unchanged:
+        return target_name, "Skipped (unchanged)", "blue", manifest_entry(
+            target_name, previous['ContentLength'], previous['Metadata'].get('sha256')
+        )
+
+    task = progress.add_task(f"[cyan]Transferring {target_name}[/cyan]", total=total)
+
+    if size and size >= RANGED_MIN_SIZE:
+        progress.update(task, total=size)
+        if source_etag:
+            metadata = {**(metadata or {}), 'source-etag': source_etag}
+        transferred = ranged_to_s3(
+            s3_client, url, target_name, size, content_type, progress, task,
+            metadata=metadata, expected_sha256=expected_sha256
+        )
+    else:
+        transferred = stream_to_s3(
+            s3_client, url, target_name, content_type, progress, task,
+            metadata=metadata, expected_sha256=expected_sha256
+        )
+    if transferred is None:
+        return target_name, "Transfer failed", "red", None
+
+    size, sha256 = transferred
+    return target_name, f"✓ {size / (1024 * 1024):.1f} MB", "green", manifest_entry(target_name, size, sha256)
+
+
+def sync_github_asset(s3_client, asset: dict, target_name: str, progress: Progress,
+                      versioned_key: str = None, versioned_objects: list = None) -> tuple:
+    """
+    Sync one GitHub release asset to MinIO. Returns a (filename, status, color, manifest_entry)
+    summary row like transfer_asset().
+
+    With versioned_key set, the installer is also stored under that key, and an
+    identical installer from an earlier version is copied server-side instead
+    of being downloaded again.
+    """
+    if not asset:
+        return target_name, "Not found", "yellow", None
+
+    # Remember the asset ID (and digest) so later runs can skip or reuse it
+    metadata = asset_metadata(asset)
+    entry = manifest_entry(target_name, asset.get('size'), metadata.get('sha256'))
+
+    if is_up_to_date(s3_client, target_name, asset):
+        # Current installer may predate --versioned: add its versioned copy
+        versioned_keys = {obj['Key'] for obj in versioned_objects or []}
+        if versioned_key and versioned_key not in versioned_keys:
+            if not copy_within_bucket(s3_client, target_name, versioned_key, metadata):
+                return target_name, "Versioned copy failed", "red", entry
+        return target_name, "Skipped (up-to-date)", "blue", entry
+
+    previous_key = find_previous_version(s3_client, asset, versioned_objects) if versioned_objects else None
+    if previous_key:
+        if not copy_within_bucket(s3_client, previous_key, target_name, metadata):
+            return target_name, "Copy failed", "red", None
+        if versioned_key != previous_key and not copy_within_bucket(s3_client, previous_key, versioned_key, metadata):
+            return target_name, "Versioned copy failed", "red", entry
+        return target_name, f"✓ Reused {previous_key}", "green", entry
+
+    row = transfer_asset(
+        s3_client, asset['browser_download_url'], target_name, progress,
+        total=asset.get('size', 0), metadata=metadata, expected_sha256=metadata.get('sha256')
+    )
+
+    if versioned_key and row[2] == "green" and not copy_within_bucket(s3_client, target_name, versioned_key, metadata):
+        return target_name, "Versioned copy failed", "red", row[3]
+    return row
+
+
+def version_key(tag: str) -> tuple:
+    """Sortable version from a release tag (cap-v0.4.82 -> (0, 4, 82))."""
+    return tuple(int(number) for number in re.findall(r'\d+', tag))
+
+
+def put_release_object(s3_client, key: str, release_tag: str, body: bytes, read_tag,
+                       allow_downgrade: bool = False, rewrite_same: bool = False, **put_args) -> tuple:
+    """
+    Write a release pointer object (version.txt, index.json) with compare-and-set
+    (If-Match / If-None-Match).
+
+    Concurrent syncs can't overwrite each other blindly, and an object naming a
+    newer release is never replaced unless allow_downgrade is set. read_tag
+    extracts the release tag from the current body. Returns (status, current_tag)
+    with status 'updated', 'current' (same release, not rewritten) or 'newer'.
+    """
+    for attempt in range(2):
+        try:
+            current = s3_client.get_object(Bucket=BUCKET_NAME, Key=key)
+            current_tag = read_tag(current['Body'].read())
+            condition = {'IfMatch': current['ETag']}
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in ('NoSuchKey', '404'):
+                raise
+            current_tag = None
+            condition = {'IfNoneMatch': '*'}
+
+        if current_tag == release_tag and not rewrite_same:
+            return 'current', current_tag
+        if current_tag and not allow_downgrade and version_key(current_tag) > version_key(release_tag):
+            return 'newer', current_tag
+
+        try:
+            s3_client.put_object(Bucket=BUCKET_NAME, Key=key, Body=body, **put_args, **condition)
+            return 'updated', current_tag
+        except ClientError as e:
+            # Another sync changed the object in between - re-read once
+            if attempt or e.response.get('Error', {}).get('Code') not in ('PreconditionFailed', 'ConditionalRequestConflict'):
+                raise
+
+
+def read_current_version(s3_client):
+    """Release tag currently named by version.txt (None if there is none yet)."""
+    try:
+        return s3_client.get_object(Bucket=BUCKET_NAME, Key="version.txt")['Body'].read().decode().strip() or None
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') not in ('NoSuchKey', '404'):
+            raise
+        return None
+
+
+def manifest_version(body: bytes):
+    """Release tag of an existing index.json (None if unreadable)."""
+    try:
+        return json.loads(body).get('version')
+    except (ValueError, AttributeError):
+        return None
+
+
+def build_manifest(release_tag: str, results: list) -> dict:
+    """Describe the installers available in the bucket (read by the download page)."""
+    # Entries come from the transfers themselves - no extra S3 requests
+    return {'version': release_tag, 'assets': [entry for *_, entry in results if entry]}
+
+
 def main():
     parser = argparse.ArgumentParser(description="Sync Cap clients to MinIO bucket")
     parser.add_argument('--version', '-v', help="Specific version tag (e.g., cap-v0.4.82)")
+    parser.add_argument('--allow-downgrade', action='store_true',
+                        help="Sync even if version.txt names a newer version")
+    parser.add_argument('--versioned', action='store_true',
+                        help=f"Also store installers under {VERSIONED_PREFIX}<tag>/ and reuse identical ones from earlier versions")
     args = parser.parse_args()
 
     load_env()
@@ -268,6 +837,17 @@ def main():
     # Get version to download - prefer CLI arg, then env var
     version = args.version or os.environ.get('CAP_VERSION', None)
 
+    # Check the bucket in the background while the release is fetched
+    # (the client itself is built here: client creation is not thread-safe)
+    startup = ThreadPoolExecutor(max_workers=1)
+    try:
+        s3_client = get_s3_client()
+        bucket_check = startup.submit(s3_client.head_bucket, Bucket=BUCKET_NAME)
+    except Exception as e:
+        console.print(f"[red]✗[/red] Connection failed: {e}")
+        sys.exit(1)
+    startup.shutdown(wait=False)
+
     # Fetch release information
     console.print("[bold]Step 1: Fetching release information[/bold]")
     try:
@@ -286,7 +866,7 @@ def main():
 
         console.print(f"[green]✓[/green] Found release: {release_name} ({release_tag})")
 
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             console.print(f"[red]✗[/red] Release not found: {version}")
             console.print("[dim]  Check available releases at:[/dim]")
@@ -313,8 +893,7 @@ def main():
     # Connect to MinIO
     console.print("\n[bold]Step 2: Connecting to MinIO[/bold]")
     try:
-        s3_client = get_s3_client()
-        s3_client.head_bucket(Bucket=BUCKET_NAME)
+        bucket_check.result()
         console.print(f"[green]✓[/green] Connected to bucket '{BUCKET_NAME}'")
     except ClientError as e:
         console.print(f"[red]✗[/red] Bucket not accessible: {e}")
@@ -324,89 +903,60 @@ def main():
         console.print(f"[red]✗[/red] Connection failed: {e}")
         sys.exit(1)
 
-    # Create temp directory for downloads
-    temp_dir = Path(tempfile.mkdtemp(prefix="cap-clients-"))
-    console.print(f"[dim]Temp directory: {temp_dir}[/dim]")
+    # Refuse to replace the installers of a newer release: the pointer
+    # objects would keep naming it while serving older binaries
+    try:
+        current_tag = read_current_version(s3_client)
+    except ClientError as e:
+        console.print(f"[red]✗[/red] Failed to read version file: {e}")
+        sys.exit(1)
+    if current_tag and version_key(current_tag) > version_key(release_tag):
+        if not args.allow_downgrade:
+            console.print(f"[yellow]![/yellow] Bucket already serves newer {current_tag} - nothing synced (use --allow-downgrade)")
+            sys.exit(0)
+        console.print(f"[yellow]![/yellow] Downgrading from {current_tag} to {release_tag}")
+
+    # Earlier versioned installers (listed once, shared by all workers)
+    versioned_objects = list_versioned_objects(s3_client) if args.versioned and github_assets else None
 
     # Download and upload assets
     console.print("\n[bold]Step 3: Downloading and uploading clients[/bold]")
 
-    results = []
-    try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            DownloadColumn(),
-            TransferSpeedColumn(),
-            TimeRemainingColumn(),
-            console=console
-        ) as progress:
-
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        TimeRemainingColumn(),
+        console=console,
+        # No live bars in CI logs / redirected output (summary table still printed)
+        disable=not console.is_terminal
+    ) as progress:
+
+        with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as executor:
             # Method 1: GitHub Assets (older releases)
             if github_assets:
-                for pattern, target_name, content_type in GITHUB_ASSET_MAPPINGS:
-                    asset = find_matching_asset(github_assets, pattern)
-
-                    if not asset:
-                        results.append((target_name, "Not found", "yellow"))
-                        continue
-
-                    # Download
-                    download_url = asset['browser_download_url']
-                    local_file = temp_dir / target_name
-                    file_size = asset.get('size', 0)
-
-                    task = progress.add_task(
-                        f"[cyan]Downloading {target_name}[/cyan]",
-                        total=file_size
+                matched_assets = match_github_assets(github_assets, release_tag)
+                futures = [
+                    executor.submit(
+                        sync_github_asset, s3_client, matched_assets.get(target_name),
+                        target_name, progress,
+                        versioned_key=f"{VERSIONED_PREFIX}{release_tag}/{target_name}" if args.versioned else None,
+                        versioned_objects=versioned_objects
                     )
-
-                    if not download_file(download_url, local_file, progress, task):
-                        results.append((target_name, "Download failed", "red"))
-                        continue
-
-                    progress.update(task, description=f"[cyan]Uploading {target_name}[/cyan]")
-
-                    # Upload
-                    if upload_to_s3(s3_client, local_file, target_name, content_type):
-                        size_mb = local_file.stat().st_size / (1024 * 1024)
-                        results.append((target_name, f"✓ {size_mb:.1f} MB", "green"))
-                    else:
-                        results.append((target_name, "Upload failed", "red"))
-
-                    # Remove temp file
-                    local_file.unlink(missing_ok=True)
+                    for _, target_name in GITHUB_ASSET_MAPPINGS
+                ]
 
             # Method 2: CrabNebula CDN (newer releases)
-            elif crabnebula_downloads:
-                for platform_text, download_url, target_name, content_type in crabnebula_downloads:
-                    local_file = temp_dir / target_name
-
-                    task = progress.add_task(
-                        f"[cyan]Downloading {target_name}[/cyan]",
-                        total=None  # Unknown size until we start
-                    )
+            else:
+                futures = [
+                    executor.submit(transfer_asset, s3_client, download_url, target_name, progress, conditional=True)
+                    for platform_text, download_url, target_name in crabnebula_downloads
+                ]
 
-                    if not download_file(download_url, local_file, progress, task):
-                        results.append((target_name, "Download failed", "red"))
-                        continue
-
-                    progress.update(task, description=f"[cyan]Uploading {target_name}[/cyan]")
-
-                    # Upload
-                    if upload_to_s3(s3_client, local_file, target_name, content_type):
-                        size_mb = local_file.stat().st_size / (1024 * 1024)
-                        results.append((target_name, f"✓ {size_mb:.1f} MB", "green"))
-                    else:
-                        results.append((target_name, "Upload failed", "red"))
-
-                    # Remove temp file
-                    local_file.unlink(missing_ok=True)
-
-    finally:
-        # Cleanup temp directory
-        shutil.rmtree(temp_dir, ignore_errors=True)
+            # Keep the summary in mapping order
+            results = [future.result() for future in futures]
 
     # Summary table
     console.print("\n[bold]Summary[/bold]")
@@ -414,33 +964,60 @@ def main():
     table.add_column("File")
     table.add_column("Status")
 
-    for filename, status, color in results:
+    for filename, status, color, _ in results:
         table.add_row(filename, f"[{color}]{status}[/{color}]")
 
     console.print(table)
 
     # Upload version info
     try:
-        version_info = f"{release_tag}\n"
-        s3_client.put_object(
-            Bucket=BUCKET_NAME,
-            Key="version.txt",
-            Body=version_info.encode(),
+        status, current_tag = put_release_object(
+            s3_client, "version.txt", release_tag, f"{release_tag}\n".encode(),
+            read_tag=lambda body: body.decode().strip(),
+            allow_downgrade=args.allow_downgrade,
             ContentType="text/plain"
         )
-        console.print(f"\n[green]✓[/green] Version file updated: {release_tag}")
-    except Exception:
-        pass
+        if status == 'newer':
+            console.print(f"\n[yellow]![/yellow] Version file kept at newer {current_tag} (use --allow-downgrade)")
+        elif status == 'current':
+            console.print(f"\n[green]✓[/green] Version file up-to-date: {release_tag}")
+        else:
+            console.print(f"\n[green]✓[/green] Version file updated: {release_tag}")
+    except ClientError as e:
+        console.print(f"\n[yellow]![/yellow] Failed to update version file: {e}")
+
+    # Upload manifest (single object, same compare-and-set and downgrade guard)
+    manifest = build_manifest(release_tag, results)
+    if not manifest['assets']:
+        console.print("[yellow]![/yellow] No installers available - manifest left unchanged")
+    else:
+        try:
+            status, current_tag = put_release_object(
+                s3_client, "index.json", release_tag, json.dumps(manifest, separators=(',', ':')).encode(),
+                read_tag=manifest_version,
+                allow_downgrade=args.allow_downgrade,
+                rewrite_same=True,
+                ContentType="application/json",
+                CacheControl="no-cache"
+            )
+            if status == 'newer':
+                console.print(f"[yellow]![/yellow] Manifest kept at newer {current_tag} (use --allow-downgrade)")
+            else:
+                console.print(f"[green]✓[/green] Manifest updated: {len(manifest['assets'])} installers")
+        except ClientError as e:
+            console.print(f"[yellow]![/yellow] Failed to update manifest: {e}")
 
     # Final info
     s3_hostname = os.environ.get('S3_HOSTNAME', 'assets.screenrecorder.app.bauer-group.com')
-    success_count = sum(1 for _, status, color in results if color == "green")
+    success_count = sum(1 for _, status, color, _ in results if color == "green")
+    skipped_count = sum(1 for _, status, color, _ in results if color == "blue")
     total_count = len(results) if results else len(GITHUB_ASSET_MAPPINGS)
 
     console.print(Panel.fit(
         f"[bold green]Sync Complete![/bold green]\n\n"
         f"Version: [cyan]{release_tag}[/cyan]\n"
-        f"Files uploaded: [cyan]{success_count}/{total_count}[/cyan]\n\n"
+        f"Files uploaded: [cyan]{success_count}/{total_count}[/cyan]\n"
+        f"Already up-to-date: [cyan]{skipped_count}[/cyan]\n\n"
         f"Download URL:\n"
         f"[cyan]https://{s3_hostname}/{BUCKET_NAME}/[/cyan]",
         border_style="green"